@@ -4,21 +4,55 @@ Runtime Settings Changer
 This script edits the runtime_config.json file to change settings
 while the main application is running.
 
-Changes take effect immediately on the next transcription/paste operation.
+Edits are written once when the menu exits and take effect on the next
+transcription/paste operation.
 """
 
-import json
+import os
+import sys
 from pathlib import Path
 
+# Use orjson (C parser) when available, stdlib json otherwise
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# Used to escape individual string values for the serialization template
+from json import dumps as _encode_value
+
 
 CONFIG_FILE = Path(__file__).parent / "runtime_config.json"
 
+# runtime_config.json has a fixed three-field schema, so serialization
+# fills a precomputed template instead of tree-walking a generic encoder.
+# Only the two string values need JSON escaping.
+_CONFIG_TEMPLATE = (
+    '{\n'
+    '  "transcription": {\n'
+    '    "language": %s,\n'
+    '    "model": %s\n'
+    '  },\n'
+    '  "paste": {\n'
+    '    "add_timestamp": %s\n'
+    '  }\n'
+    '}'
+)
+
+
+def _dumps(config_data):
+    """Serialize the fixed-schema runtime config to UTF-8 bytes."""
+    return (_CONFIG_TEMPLATE % (
+        _encode_value(config_data['transcription']['language']),
+        _encode_value(config_data['transcription']['model']),
+        'true' if config_data['paste']['add_timestamp'] else 'false',
+    )).encode('utf-8')
+
 
 def load_config():
     """Load the current runtime configuration."""
     if CONFIG_FILE.exists():
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
+        return _loads(CONFIG_FILE.read_bytes())
     else:
         return {
             "transcription": {
@@ -32,77 +66,122 @@ def load_config():
 
 
 def save_config(config_data):
-    """Save the runtime configuration."""
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config_data, f, indent=2)
+    """Save the runtime configuration atomically (write to temp, then rename).
+
+    The main application may read runtime_config.json at any moment from
+    the hotkey thread, so the file is never left in a half-written state.
+    """
+    tmp_file = CONFIG_FILE.with_suffix('.json.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(_dumps(config_data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, CONFIG_FILE)
     print(f"\nConfiguration saved to: {CONFIG_FILE}")
 
 
 def show_current_settings(config_data):
-    """Display current settings."""
-    print("\n" + "="*50)
-    print("Current Runtime Settings")
-    print("="*50)
-    print(f"Language: {config_data['transcription']['language']}")
-    print(f"Model: {config_data['transcription']['model']}")
-    print(f"Add Timestamp: {config_data['paste']['add_timestamp']}")
-    print("="*50)
+    """Display current settings with a single stdout write."""
+    sys.stdout.write(
+        "\n" + "="*50 + "\n"
+        "Current Runtime Settings\n"
+        + "="*50 + "\n"
+        f"Language: {config_data['transcription']['language']}\n"
+        f"Model: {config_data['transcription']['model']}\n"
+        f"Add Timestamp: {config_data['paste']['add_timestamp']}\n"
+        + "="*50 + "\n"
+    )
+
+
+def change_language(config_data):
+    """Prompt for a new language code. Returns True if changed."""
+    print("\nCommon language codes:")
+    print("  en - English")
+    print("  pt - Portuguese  ")
+    print("  es - Spanish")
+    print("  fr - French")
+    print("  de - German")
+    print("  it - Italian")
+
+    new_lang = input("\nEnter language code: ").strip()
+    if new_lang:
+        config_data['transcription']['language'] = new_lang
+        print(f"Language set to: {new_lang}")
+        print("Will be saved on exit and take effect on next transcription!")
+        return True
+    return False
+
+
+def change_model(config_data):
+    """Prompt for a new model name. Returns True if changed."""
+    new_model = input("\nEnter model name (default: whisper-1): ").strip()
+    if new_model:
+        config_data['transcription']['model'] = new_model
+        print(f"Model set to: {new_model}")
+        print("Will be saved on exit and take effect on next transcription!")
+        return True
+    return False
+
+
+def toggle_timestamp(config_data):
+    """Toggle the paste timestamp flag. Always returns True."""
+    config_data['paste']['add_timestamp'] = not config_data['paste']['add_timestamp']
+    status = "ENABLED" if config_data['paste']['add_timestamp'] else "DISABLED"
+    print(f"Timestamp prefix {status}")
+    print("Will be saved on exit and take effect on next paste!")
+    return True
+
+
+# Menu dispatch table: choice -> handler mutating config_data in place
+ACTIONS = {
+    "1": change_language,
+    "2": change_model,
+    "3": toggle_timestamp,
+}
 
 
 def main():
-    """Main menu."""
+    """Main menu.
+
+    Edits accumulate in memory and are written to disk once on exit, so a
+    session with several changes costs a single file write (and a single
+    mtime bump for readers polling the config).
+    """
     config_data = load_config()
-    
-    while True:
-        print("\n" + "="*50)
-        print("Runtime Settings Changer")
-        print("="*50)
-        show_current_settings(config_data)
-        print("\n1. Change language (current: {})".format(config_data['transcription']['language']))
-        print("2. Change model (current: {})".format(config_data['transcription']['model']))
-        print("3. Toggle timestamp (current: {})".format(config_data['paste']['add_timestamp']))
-        print("4. Exit")
-        print("="*50)
-        
-        choice = input("\nSelect option (1-4): ").strip()
-        
-        if choice == "1":
-            print("\nCommon language codes:")
-            print("  en - English")
-            print("  pt - Portuguese  ")
-            print("  es - Spanish")
-            print("  fr - French")
-            print("  de - German")
-            print("  it - Italian")
-            
-            new_lang = input("\nEnter language code: ").strip()
-            if new_lang:
-                config_data['transcription']['language'] = new_lang
-                save_config(config_data)
-                print(f"Language set to: {new_lang}")
-                print("Will take effect on next transcription!")
-        
-        elif choice == "2":
-            new_model = input("\nEnter model name (default: whisper-1): ").strip()
-            if new_model:
-                config_data['transcription']['model'] = new_model
-                save_config(config_data)
-                print(f"Model set to: {new_model}")
-                print("Will take effect on next transcription!")
-        
-        elif choice == "3":
-            config_data['paste']['add_timestamp'] = not config_data['paste']['add_timestamp']
+    dirty = False
+
+    try:
+        while True:
+            sys.stdout.write(
+                "\n" + "="*50 + "\n"
+                "Runtime Settings Changer\n"
+                + "="*50 + "\n"
+            )
+            show_current_settings(config_data)
+            sys.stdout.write(
+                f"\n1. Change language (current: {config_data['transcription']['language']})\n"
+                f"2. Change model (current: {config_data['transcription']['model']})\n"
+                f"3. Toggle timestamp (current: {config_data['paste']['add_timestamp']})\n"
+                "4. Exit\n"
+                + "="*50 + "\n"
+            )
+            sys.stdout.flush()
+
+            choice = input("\nSelect option (1-4): ").strip()
+
+            if choice == "4":
+                print("\nExiting...")
+                break
+
+            action = ACTIONS.get(choice)
+            if action is None:
+                print("\nInvalid choice.")
+            elif action(config_data):
+                dirty = True
+    finally:
+        # Single coalesced write for the whole session (also runs on Ctrl+C)
+        if dirty:
             save_config(config_data)
-            status = "ENABLED" if config_data['paste']['add_timestamp'] else "DISABLED"
-            print(f"Timestamp prefix {status}")
-            print("Will take effect on next paste!")
-        
-        elif choice == "4":
-            print("\nExiting...")
-            break
-        
-        else:
-            print("\nInvalid choice.")
 
 
 if __name__ == "__main__":
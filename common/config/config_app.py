@@ -8,7 +8,29 @@ All configuration values use dataclasses for better IDE support and type safety.
 
 import os
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional
+
+
+def _parse_bool_env(name: str) -> Optional[bool]:
+    """
+    Parse a boolean environment variable.
+
+    Args:
+        name: Environment variable name
+
+    Returns:
+        Optional[bool]: Parsed value, or None if the variable is not set
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return None
+    return value.lower() in ("true", "1", "yes", "on")
+
+
+# Environment overrides are parsed once at import time so per-instance
+# __post_init__ lookups are not needed (priority 1: environment variable,
+# priority 3: dataclass field default; .env loading would be priority 2)
+_ADD_TIMESTAMP_ENV = _parse_bool_env("ADD_TIMESTAMP")
 
 
 @dataclass
@@ -26,21 +48,27 @@ class DependencyCheckFlags:
     check_ffmpeg: bool = True
     check_pydub: bool = True
     check_openai_api_key: bool = True
-    
+
     def get_enabled_checks(self) -> List[str]:
         """
         Get a list of enabled check names.
-        
+
+        The result is computed once and cached, since the flags are fixed
+        for the lifetime of the configuration instance.
+
         Returns:
             List[str]: List of enabled check names
         """
-        enabled = []
-        if self.check_ffmpeg:
-            enabled.append('ffmpeg')
-        if self.check_pydub:
-            enabled.append('pydub')
-        if self.check_openai_api_key:
-            enabled.append('openai_api_key')
+        enabled = self.__dict__.get('_enabled_checks')
+        if enabled is None:
+            enabled = []
+            if self.check_ffmpeg:
+                enabled.append('ffmpeg')
+            if self.check_pydub:
+                enabled.append('pydub')
+            if self.check_openai_api_key:
+                enabled.append('openai_api_key')
+            self.__dict__['_enabled_checks'] = enabled
         return enabled
 
 
@@ -52,17 +80,9 @@ class PasteConfig:
     Attributes:
         add_timestamp: If True, prefix pasted content with current timestamp
     """
-    add_timestamp: bool = True
-    
-    def __post_init__(self):
-        """Load configuration from environment variables if available."""
-        # Load from environment variable (priority 1)
-        env_value = os.environ.get("ADD_TIMESTAMP")
-        if env_value is not None:
-            # Convert string to boolean (case-insensitive)
-            self.add_timestamp = env_value.lower() in ("true", "1", "yes", "on")
-        # Note: .env file loading would happen here if implemented (priority 2)
-        # Default value from dataclass field is priority 3
+    add_timestamp: bool = field(
+        default_factory=lambda: _ADD_TIMESTAMP_ENV if _ADD_TIMESTAMP_ENV is not None else True
+    )
 
 
 @dataclass
@@ -70,13 +90,6 @@ class AppConfig:
     """Complete application configuration."""
     dependency_checks: DependencyCheckFlags = field(default_factory=DependencyCheckFlags)
     paste: PasteConfig = field(default_factory=PasteConfig)
-    
-    def __post_init__(self):
-        """Initialize nested configs if not provided."""
-        if self.dependency_checks is None:
-            self.dependency_checks = DependencyCheckFlags()
-        if self.paste is None:
-            self.paste = PasteConfig()
 
 
 # Default configuration instance
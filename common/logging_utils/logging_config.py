@@ -34,6 +34,7 @@ Date: [Current Date]
 Version: 2.0.0
 """
 
+import functools
 import logging
 import logging.handlers
 import os
@@ -221,6 +222,7 @@ def set_console_level(logger: logging.Logger, level: str) -> None:
             handler.setLevel(log_level)
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(
     logger_name: str,
     log_dir: Optional[Path] = None,
@@ -263,6 +265,8 @@ def get_logger(
         
     Note:
         - Logger configuration merges defaults with per-logger overrides
+        - Repeated calls with the same arguments return the memoized logger
+          instance without re-merging configuration
         - Existing loggers are returned without modification
         - Log directory is created automatically if it doesn't exist
         - File rotation occurs at 10MB with 7 backup files
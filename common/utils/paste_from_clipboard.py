@@ -4,77 +4,203 @@ Clipboard paste utility for the jassist application.
 Provides functionality to paste content from the clipboard using pyautogui.
 """
 
+import threading
+import time
+from pathlib import Path
+
+# Use orjson (C parser) when available, stdlib json otherwise
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+import pyautogui
+import pyperclip
+
+from common.logging_utils import get_logger
+from common.config.config_app import config
+
+# Module-level logger, resolved once instead of per paste call
+_logger = get_logger('paste_from_clipboard')
+
+# Resolved once at import - .resolve() performs a realpath syscall, so
+# rebuilding this path on every paste would cost a syscall plus several
+# Path allocations
+_RUNTIME_CONFIG_PATH = Path(__file__).resolve().parent.parent.parent / "runtime_config.json"
+
+# Cache for the parsed runtime config, keyed on the file's mtime so edits
+# made by change_settings.py or the dashboard are picked up immediately
+# without re-reading the file on every paste.
+_RUNTIME_CFG_CACHE = {"mtime": None, "data": None}
+
+
+def _load_runtime_config(runtime_config_path):
+    """
+    Load and parse runtime_config.json, reusing the cached parse if the
+    file has not changed since the last read.
+
+    Args:
+        runtime_config_path (Path): Path to runtime_config.json
+
+    Returns:
+        dict: Parsed runtime configuration, or None if the file is missing
+    """
+    try:
+        mtime = runtime_config_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    if mtime == _RUNTIME_CFG_CACHE["mtime"]:
+        return _RUNTIME_CFG_CACHE["data"]
+
+    runtime_cfg = _json_loads(runtime_config_path.read_bytes())
+
+    _RUNTIME_CFG_CACHE["mtime"] = mtime
+    _RUNTIME_CFG_CACHE["data"] = runtime_cfg
+    return runtime_cfg
+
+
+def _do_paste(count):
+    """
+    Perform a single coalesced paste operation.
+
+    Args:
+        count (int): Number of paste requests being coalesced. The pasted
+            content is followed by one trailing space per request.
+    """
+    logger = _logger
+
+    try:
+        # Try to read from runtime config file if it exists
+        add_timestamp = config.paste.add_timestamp
+        try:
+            runtime_cfg = _load_runtime_config(_RUNTIME_CONFIG_PATH)
+            if runtime_cfg is not None:
+                add_timestamp = runtime_cfg.get("paste", {}).get("add_timestamp", add_timestamp)
+                logger.debug(f"Loaded runtime config from {_RUNTIME_CONFIG_PATH}")
+        except (OSError, ValueError) as e:
+            # OSError: unreadable file; ValueError: malformed JSON
+            # (JSONDecodeError subclasses ValueError). A missing file is
+            # the common case and is handled silently by the loader.
+            logger.debug("Could not read runtime config, using default: %s", e)
+
+        # Check if timestamp should be added
+        if add_timestamp:
+            logger.debug("add_timestamp flag is enabled, generating timestamp")
+            # Format as YY MM DD HH:MM:SS (2-digit year, space-separated)
+            # built directly from the time struct - cheaper than
+            # datetime.now() + locale-aware strftime for a fixed format
+            t = time.localtime()
+            timestamp_str = (
+                f"{t.tm_year % 100:02d} {t.tm_mon:02d} {t.tm_mday:02d} "
+                f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+            )
+            # Type the timestamp prefix directly instead of rewriting the
+            # clipboard - avoids a pyperclip.copy round-trip (a subprocess
+            # on Windows) and leaves the user's clipboard untouched
+            pyautogui.write(f"{timestamp_str} ", interval=0)
+            logger.debug(f"Timestamp prefix typed: {timestamp_str}")
+
+        # Use platform-agnostic approach (works on both Windows and macOS)
+        pyautogui.hotkey('ctrl', 'v')
+        logger.debug("Attempting to paste clipboard content")
+
+        # Add a space after the pasted content for proper separation, one
+        # per coalesced request (press('space') skips write()'s
+        # per-character keycode mapping for the single-request case)
+        if count == 1:
+            pyautogui.press('space')
+        else:
+            pyautogui.write(' ' * count, interval=0)
+        logger.debug("Added trailing space after pasted content")
+
+        logger.info("Clipboard content pasted successfully with trailing space")
+    except Exception as e:
+        logger.error(f"Error during clipboard paste operation: {e}")
+
+
+class _Debouncer:
+    """
+    Coalesces bursts of paste requests into a single paste.
+
+    If the hotkey auto-repeats while held, each event would otherwise
+    trigger an independent clipboard read + Ctrl+V + trailing space.
+    Requests arriving within the debounce window instead bump a counter
+    and reset a timer; when the window closes, one paste is issued with
+    the accumulated trailing spaces.
+    """
+
+    def __init__(self, window=0.05):
+        self._window = window
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._timer = None
+
+    def request(self):
+        """Register a paste request, (re)starting the debounce timer."""
+        with self._lock:
+            self._pending += 1
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self._window, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush(self):
+        with self._lock:
+            count = self._pending
+            self._pending = 0
+            self._timer = None
+        if count:
+            _do_paste(count)
+
+    def flush(self):
+        """
+        Perform any pending paste immediately, cancelling the timer.
+
+        Needed on the standalone __main__ path: the timer thread is a
+        daemon, so the interpreter would otherwise exit before it fires.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+        self._flush()
+
+
+_debouncer = _Debouncer()
+
+
 def paste_clipboard():
     """
     Paste content from clipboard using pyautogui and add a trailing space.
-    
-    This function checks if there's content in the clipboard, uses
-    pyautogui to simulate Ctrl+V (or Command+V on macOS) to paste it,
-    and then adds a space to separate it from future content.
-    
+
+    This function checks if there's content in the clipboard, then
+    schedules a paste (Ctrl+V, or Command+V on macOS) followed by a
+    trailing space. Bursts of calls within the debounce window (e.g. a
+    held, auto-repeating hotkey) are coalesced into a single paste.
+
     If the add_timestamp config flag is enabled, the content will be
     prefixed with the current timestamp before pasting.
-    
+
     Returns:
-        bool: True if paste was successful, False otherwise
+        bool: True if the paste was scheduled, False if the clipboard
+            was empty or unreadable
     """
-    # Import here to avoid circular import issues
-    import pyperclip
-    import pyautogui
-    from datetime import datetime
-    from common.logging_utils import get_logger
-    from common.config.config_app import config
-    
-    logger = get_logger('paste_from_clipboard')
-    
     try:
         content = pyperclip.paste()
         if content:
-            # Try to read from runtime config file if it exists
-            add_timestamp = config.paste.add_timestamp
-            try:
-                from pathlib import Path
-                import json
-                runtime_config_path = Path(__file__).resolve().parent.parent.parent / "runtime_config.json"
-                if runtime_config_path.exists():
-                    with open(runtime_config_path, 'r') as f:
-                        runtime_cfg = json.load(f)
-                    add_timestamp = runtime_cfg.get("paste", {}).get("add_timestamp", add_timestamp)
-                    logger.debug(f"Loaded runtime config from {runtime_config_path}")
-            except Exception as e:
-                logger.debug(f"Could not read runtime config, using default: {e}")
-            
-            # Check if timestamp should be added
-            if add_timestamp:
-                logger.debug("add_timestamp flag is enabled, generating timestamp")
-                # Generate timestamp using datetime.now()
-                timestamp = datetime.now()
-                # Format as YY MM DD HH:MM:SS (2-digit year, space-separated)
-                timestamp_str = timestamp.strftime("%y %m %d %H:%M:%S")
-                # Prefix content with timestamp and space
-                content = f"{timestamp_str} {content}"
-                logger.debug(f"Timestamp prefix added: {timestamp_str}")
-                # Copy the modified content back to clipboard
-                pyperclip.copy(content)
-                logger.debug("Modified content copied back to clipboard")
-            
-            # Use platform-agnostic approach (works on both Windows and macOS)
-            pyautogui.hotkey('ctrl', 'v')  
-            logger.debug("Attempting to paste clipboard content")
-            
-            # Add a space after the pasted content for proper separation
-            pyautogui.write(' ')
-            logger.debug("Added trailing space after pasted content")
-            
-            logger.info("Clipboard content pasted successfully with trailing space")
+            _debouncer.request()
             return True
         else:
-            logger.warning("Clipboard was empty, nothing to paste")
+            _logger.warning("Clipboard was empty, nothing to paste")
             return False
     except Exception as e:
-        logger.error(f"Error during clipboard paste operation: {e}")
+        _logger.error(f"Error during clipboard paste operation: {e}")
         return False
 
 if __name__ == "__main__":
     result = paste_clipboard()
+    # Run the debounced paste before the interpreter exits and kills
+    # the daemon timer thread
+    _debouncer.flush()
     print(f"Paste operation result: {result}")
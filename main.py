@@ -12,11 +12,9 @@ Or to run dependency checks:
     python main.py --apply-checks
 """
 
+import os
 import sys
-import argparse
 import threading
-import subprocess
-import time
 from pathlib import Path
 
 # Add src to path for imports
@@ -26,9 +24,10 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 try:
     from common.logging_utils import get_logger
     from common.config import config
-    from src.check_dependencies import check_all_dependencies, print_results
-    from src.hotkey_detect.hotkey_detector import HotkeyDetector
-    
+    # src.check_dependencies and HotkeyDetector are imported lazily in
+    # main(): the former is only needed under --apply-checks and the
+    # latter pulls in the audio stack (sounddevice/numpy)
+
     logger = get_logger("main")
 except Exception as e:
     print("\n" + "="*70)
@@ -49,69 +48,62 @@ except Exception as e:
     sys.exit(1)
 
 
-def start_django_server():
+def _launch_django():
     """
-    Start the Django web dashboard server in a background thread.
-    
-    This function runs the Django development server on port 8030
-    to provide a web interface for changing settings on the fly.
+    Serve the Django dashboard in-process via a wsgiref server.
+
+    Runs on a background thread so the main thread can continue with
+    hotkey detector initialization while Django starts up. Mounting the
+    WSGI app in this interpreter avoids spawning a second Python process
+    (and a second copy of the Django stack in memory).
     """
     try:
-        logger.info("Starting Django web dashboard on port 8030")
-        print("Starting Django web dashboard on http://localhost:8030")
-        
-        # Get the path to the Django manage.py script
         django_dir = Path(__file__).parent / "web_dashboard"
-        manage_py = django_dir / "manage.py"
-        
-        if not manage_py.exists():
-            logger.warning(f"Django manage.py not found at {manage_py}")
-            print("Warning: Django dashboard not available (manage.py not found)")
+        if not (django_dir / "manage.py").exists():
+            logger.warning(f"Django project not found at {django_dir}")
+            print("Warning: Django dashboard not available (web_dashboard not found)")
             return
-        
-        # Start Django server as a subprocess
-        # Using creationflags on Windows to prevent showing a separate console window
-        import platform
-        if platform.system() == "Windows":
-            # On Windows, hide the Django server console
-            subprocess.Popen(
-                [sys.executable, str(manage_py), "runserver", "8030", "--noreload"],
-                cwd=str(django_dir),
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-        else:
-            # On Linux/Mac
-            subprocess.Popen(
-                [sys.executable, str(manage_py), "runserver", "8030", "--noreload"],
-                cwd=str(django_dir),
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-        
-        # Give Django a moment to start
-        time.sleep(2)
+
+        # Make the Django project importable and configure settings
+        sys.path.insert(0, str(django_dir))
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dashboard_project.settings')
+
+        import django
+        django.setup()
+        from django.core.wsgi import get_wsgi_application
+        from wsgiref.simple_server import make_server, WSGIRequestHandler
+
+        class _QuietRequestHandler(WSGIRequestHandler):
+            """Suppress per-request console logging from wsgiref."""
+            def log_message(self, format, *args):
+                pass
+
+        server = make_server(
+            'localhost', 8030,
+            get_wsgi_application(),
+            handler_class=_QuietRequestHandler
+        )
+
         logger.info("Django web dashboard started successfully")
         print("Dashboard ready at http://localhost:8030\n")
-        
+        server.serve_forever()
+
     except Exception as e:
         logger.error(f"Failed to start Django server: {e}")
         print(f"Warning: Could not start Django dashboard: {e}")
         print("The application will continue without the web dashboard.\n")
 
 
-def parse_args():
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        description="Speech-to-Text Application with Hotkey Recording"
-    )
-    parser.add_argument(
-        "--apply-checks",
-        action="store_true",
-        help="Run dependency checks before starting the application"
-    )
-    return parser.parse_args()
+def start_django_server():
+    """
+    Start the Django web dashboard server without blocking the main thread.
+
+    The WSGI server runs on a daemon thread so hotkey detector
+    initialization proceeds concurrently with Django startup on port 8030.
+    """
+    logger.info("Starting Django web dashboard on port 8030")
+    print("Starting Django web dashboard on http://localhost:8030")
+    threading.Thread(target=_launch_django, daemon=True).start()
 
 
 def main():
@@ -121,10 +113,14 @@ def main():
         print("L-SPEECH-TO-TEXT - Starting...")
         print("="*70)
         
-        args = parse_args()
-        
+        # The only supported flag - checking sys.argv directly avoids
+        # building an ArgumentParser (and importing argparse) at startup
+        apply_checks = "--apply-checks" in sys.argv[1:]
+
         # Run dependency checks only if requested
-        if args.apply_checks:
+        if apply_checks:
+            from src.check_dependencies import check_all_dependencies, print_results
+
             logger.info("Running dependency checks as requested")
             # Log which checks are enabled
             enabled_checks = config.dependency_checks.get_enabled_checks()
@@ -152,6 +148,7 @@ def main():
         # Start the hotkey detector
         logger.info("Initializing hotkey detector")
         print("Initializing hotkey detector...")
+        from src.hotkey_detect.hotkey_detector import HotkeyDetector
         detector = HotkeyDetector()
         detector.start()
         
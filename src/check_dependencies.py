@@ -12,9 +12,14 @@ Usage:
     python src/check_dependencies.py
 """
 
+import functools
+import hashlib
+import shutil
 import sys
 import subprocess
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from common.logging_utils import get_logger
@@ -23,13 +28,33 @@ from common.config import config
 logger = get_logger("dependency_checker")
 
 
-def check_ffmpeg():
+@functools.lru_cache(maxsize=2)
+def check_ffmpeg(verify_version=False):
     """
     Check if FFmpeg is installed and accessible.
-    
+
+    By default only a PATH lookup is performed (shutil.which - no process
+    spawn). Pass verify_version=True to also run `ffmpeg -version` and
+    confirm the binary actually executes.
+
+    The result is cached for the lifetime of the process - the answer
+    cannot change during a run, so repeated calls skip the lookup.
+
+    Args:
+        verify_version: If True, spawn ffmpeg to verify it runs and
+            report its version string
+
     Returns:
         tuple: (bool, str) - (is_installed, message)
     """
+    if not verify_version:
+        path = shutil.which('ffmpeg')
+        if path:
+            logger.info(f"FFmpeg found at {path}")
+            return True, f"[OK] FFmpeg found at {path}"
+        logger.error("FFmpeg not found in system PATH")
+        return False, "[FAIL] FFmpeg is NOT installed"
+
     try:
         result = subprocess.run(
             ['ffmpeg', '-version'],
@@ -57,10 +82,13 @@ def check_ffmpeg():
         return False, f"[FAIL] Error checking FFmpeg: {e}"
 
 
+@functools.lru_cache(maxsize=1)
 def check_pydub():
     """
     Check if pydub is installed.
-    
+
+    The result is cached for the lifetime of the process.
+
     Returns:
         tuple: (bool, str) - (is_installed, message)
     """
@@ -77,62 +105,106 @@ def check_pydub():
 def check_openai_api_key():
     """
     Check if OPENAI_API_KEY environment variable is set and validate it by making an API call.
-    
+
     Returns:
         tuple: (bool, str) - (is_valid, message)
     """
     api_key = os.environ.get("OPENAI_API_KEY")
-    
+
     if not api_key:
         logger.error("OPENAI_API_KEY not set in environment variables")
         return False, "[FAIL] OPENAI_API_KEY environment variable is NOT set in environment variables"
-    
+
     # Check if key is empty or whitespace only
     if not api_key.strip():
         logger.error("OPENAI_API_KEY is set but empty")
         return False, "[FAIL] OPENAI_API_KEY environment variable is set but empty (no value provided)"
-    
+
+    # Short-circuit on a recent validation of the same key bytes. Results
+    # (including failures) are cached for the TTL, then revalidated, so a
+    # key revoked server-side is eventually noticed without paying an
+    # HTTPS round-trip on every check.
+    key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+    cached = _KEY_VALIDATION_CACHE.get(key_hash)
+    if cached is not None and time.time() - cached[0] < _KEY_VALIDATION_TTL:
+        return cached[1]
+
+    result = _validate_openai_api_key(api_key)
+    _KEY_VALIDATION_CACHE[key_hash] = (time.time(), result)
+    return result
+
+
+# Validation results keyed by sha256(api_key): hash -> (timestamp, result)
+_KEY_VALIDATION_CACHE = {}
+_KEY_VALIDATION_TTL = 600  # seconds
+
+
+def _validate_openai_api_key(api_key):
+    """
+    Validate an OpenAI API key against the API.
+
+    Args:
+        api_key: The API key to validate
+
+    Returns:
+        tuple: (bool, str) - (is_valid, message)
+    """
     # Show first and last 4 characters for security
     masked = f"{api_key[:4]}...{api_key[-4:]}" if len(api_key) > 8 else "****"
-    
-    # Validate the API key by making an actual API call
-    logger.debug(f"Validating OpenAI API key ({masked})...")
+
+    # Probe the configured transcription model so one round-trip validates
+    # both the key (401) and the model's availability (404)
     try:
-        import requests
-        
-        url = "https://api.openai.com/v1/models"
-        headers = {"Authorization": f"Bearer {api_key}"}
-        
-        # Make a lightweight GET request to validate the key
-        response = requests.get(url, headers=headers, timeout=5)
-        
-        if response.status_code == 200:
+        from transcriber.configs.transcribe_config import config as transcribe_config
+        model = transcribe_config.model
+    except ImportError:
+        model = "whisper-1"
+
+    # Validate the API key by making an actual API call. Uses stdlib
+    # http.client so the dependency checker does not pay the requests
+    # import tax (urllib3/certifi/idna) for a single GET.
+    logger.debug(f"Validating OpenAI API key ({masked}) against model {model}...")
+    try:
+        import http.client
+        import socket
+
+        conn = http.client.HTTPSConnection("api.openai.com", timeout=5)
+        try:
+            # Probe a single model instead of listing all models - the
+            # response is a few hundred bytes rather than ~10 KB, and the
+            # 200/401 semantics are identical
+            conn.request("GET", f"/v1/models/{model}", headers={"Authorization": f"Bearer {api_key}"})
+            response = conn.getresponse()
+            status_code = response.status
+            body = response.read().decode('utf-8', errors='replace')
+        finally:
+            conn.close()
+
+        if status_code == 200:
             logger.info(f"OpenAI API key is valid ({masked})")
             return True, f"[OK] OPENAI_API_KEY is valid ({masked})"
-        elif response.status_code == 401:
+        elif status_code == 401:
             logger.error(f"OpenAI API key is invalid, expired, or not properly created ({masked})")
             logger.error("This could mean: key is invalid, expired, revoked, or incorrectly formatted")
             return False, "[FAIL] OPENAI_API_KEY is invalid, expired, or not properly created - verify your API key at https://platform.openai.com/api-keys"
+        elif status_code == 404:
+            logger.error(f"Transcription model '{model}' not available to this account ({masked})")
+            return False, f"[FAIL] Transcription model '{model}' is not available to this account (key is valid)"
         else:
             # Other API errors
-            error_msg = response.text if response.text else "Unknown error"
-            logger.error(f"OpenAI API validation failed: {response.status_code} - {error_msg}")
+            error_msg = body if body else "Unknown error"
+            logger.error(f"OpenAI API validation failed: {status_code} - {error_msg}")
             logger.error(f"API key present in environment: {masked}")
-            return False, f"[FAIL] Cannot validate OPENAI_API_KEY: API returned {response.status_code} - {error_msg}"
-            
-    except requests.exceptions.Timeout:
+            return False, f"[FAIL] Cannot validate OPENAI_API_KEY: API returned {status_code} - {error_msg}"
+
+    except socket.timeout:
         logger.error(f"OpenAI API key validation timed out ({masked})")
         logger.error("API key is present in environment variables but validation failed due to network timeout")
         return False, "[FAIL] OPENAI_API_KEY is set but validation failed: Network timeout (check internet connection)"
-    except requests.exceptions.ConnectionError as e:
+    except OSError as e:
         logger.error(f"OpenAI API key validation connection error ({masked}): {e}")
         logger.error("API key is present in environment variables but validation failed due to network error")
         return False, f"[FAIL] OPENAI_API_KEY is set but validation failed: Network error - {str(e)}"
-    except ImportError:
-        logger.error("requests library not available for API key validation")
-        logger.warning("Falling back to basic check (only verifying environment variable is set)")
-        # Fallback to basic check if requests is not available
-        return True, f"[OK] OPENAI_API_KEY is set ({masked}) [validation skipped - requests not installed]"
     except Exception as e:
         logger.error(f"Unexpected error validating OpenAI API key ({masked}): {e}")
         logger.error("API key is present in environment variables but validation encountered an unexpected error")
@@ -141,98 +213,105 @@ def check_openai_api_key():
         return False, f"[FAIL] OPENAI_API_KEY is set but validation failed: {str(e)}"
 
 
+# All known dependency checks in display order: name -> check function.
+# The enabled/disabled flag for each lives on config.dependency_checks
+# as check_<name>.
+CHECK_FUNCTIONS = {
+    'ffmpeg': check_ffmpeg,
+    'pydub': check_pydub,
+    'openai_api_key': check_openai_api_key,
+}
+ALL_CHECKS = tuple(CHECK_FUNCTIONS)
+
+
 def check_all_dependencies():
     """
     Check all enabled dependencies based on configuration flags.
-    
+
+    The checks are independent and I/O-bound (subprocess wait, import,
+    HTTPS round-trip), so they run concurrently on a small thread pool
+    and total wall time is the slowest check rather than the sum.
+
     Returns:
         dict: Status of all dependency checks (only enabled checks are included)
     """
-    results = {}
-    
-    # Check FFmpeg if enabled
-    if config.dependency_checks.check_ffmpeg:
-        logger.debug("Running FFmpeg check (enabled)")
-        results['ffmpeg'] = check_ffmpeg()
-    else:
-        logger.debug("Skipping FFmpeg check (disabled in config)")
-    
-    # Check pydub if enabled
-    if config.dependency_checks.check_pydub:
-        logger.debug("Running pydub check (enabled)")
-        results['pydub'] = check_pydub()
-    else:
-        logger.debug("Skipping pydub check (disabled in config)")
-    
-    # Check OpenAI API key if enabled
-    if config.dependency_checks.check_openai_api_key:
-        logger.debug("Running OpenAI API key check (enabled)")
-        results['openai_api_key'] = check_openai_api_key()
-    else:
-        logger.debug("Skipping OpenAI API key check (disabled in config)")
-    
+    checks = {}
+
+    # Collect enabled checks
+    for name, fn in CHECK_FUNCTIONS.items():
+        if getattr(config.dependency_checks, f'check_{name}'):
+            logger.debug(f"Running {name} check (enabled)")
+            checks[name] = fn
+        else:
+            logger.debug(f"Skipping {name} check (disabled in config)")
+
+    if not checks:
+        return {}
+
+    # Run all enabled checks concurrently
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {name: executor.submit(fn) for name, fn in checks.items()}
+        results = {name: future.result() for name, future in futures.items()}
+
     return results
 
 
 def print_results(results):
     """
     Print formatted results of dependency checks.
-    
+
+    The report is accumulated into a list of lines and emitted with a
+    single stdout write rather than one syscall per print.
+
     Args:
         results: Dictionary of check results
-        
+
     Returns:
         bool: True if all checks passed, False otherwise
     """
-    print("\n" + "=" * 70)
-    print("DEPENDENCY CHECK RESULTS")
-    print("=" * 70)
-    
+    lines = ["", "=" * 70, "DEPENDENCY CHECK RESULTS", "=" * 70]
+
     # Show which checks are enabled/disabled
     enabled_checks = config.dependency_checks.get_enabled_checks()
     if enabled_checks:
-        print(f"Enabled checks: {', '.join(enabled_checks)}")
-    
-    disabled_checks = []
-    if not config.dependency_checks.check_ffmpeg:
-        disabled_checks.append('ffmpeg')
-    if not config.dependency_checks.check_pydub:
-        disabled_checks.append('pydub')
-    if not config.dependency_checks.check_openai_api_key:
-        disabled_checks.append('openai_api_key')
-    
+        lines.append(f"Enabled checks: {', '.join(enabled_checks)}")
+
+    disabled_checks = [c for c in ALL_CHECKS if c not in enabled_checks]
+
     if disabled_checks:
-        print(f"Disabled checks: {', '.join(disabled_checks)}")
-    
-    print("=" * 70)
-    
+        lines.append(f"Disabled checks: {', '.join(disabled_checks)}")
+
+    lines.append("=" * 70)
+
     if not results:
-        print("\n[INFO] No checks were enabled. All dependency checks are disabled.")
+        lines.append("\n[INFO] No checks were enabled. All dependency checks are disabled.")
+        sys.stdout.write("\n".join(lines) + "\n")
         return True
-    
+
     all_ok = True
     for name, (status, message) in results.items():
-        print(f"{message}")
+        lines.append(message)
         if not status:
             all_ok = False
-    
-    print("=" * 70)
-    
+
+    lines.append("=" * 70)
+
     if all_ok:
-        print("\n[OK] All checked dependencies are satisfied!")
-        print("You can run the application normally.")
+        lines.append("\n[OK] All checked dependencies are satisfied!")
+        lines.append("You can run the application normally.")
     else:
-        print("\n[FAIL] Some dependencies are missing or incorrect.")
-        print("\nRequired for audio format conversion:")
-        print("  - FFmpeg: https://ffmpeg.org/download.html")
-        print("  - pydub: pip install pydub")
-        print("\nRequired for transcription:")
-        print("  - OPENAI_API_KEY: Set this environment variable")
-        print("    Windows: set OPENAI_API_KEY=your_key_here")
-        print("    Linux/Mac: export OPENAI_API_KEY=your_key_here")
-    
-    print("\n" + "=" * 70)
-    
+        lines.append("\n[FAIL] Some dependencies are missing or incorrect.")
+        lines.append("\nRequired for audio format conversion:")
+        lines.append("  - FFmpeg: https://ffmpeg.org/download.html")
+        lines.append("  - pydub: pip install pydub")
+        lines.append("\nRequired for transcription:")
+        lines.append("  - OPENAI_API_KEY: Set this environment variable")
+        lines.append("    Windows: set OPENAI_API_KEY=your_key_here")
+        lines.append("    Linux/Mac: export OPENAI_API_KEY=your_key_here")
+
+    lines.append("\n" + "=" * 70)
+
+    sys.stdout.write("\n".join(lines) + "\n")
     return all_ok
 
 
@@ -5,7 +5,7 @@ This module defines the configuration for hotkey detection and recording.
 All configuration values use dataclasses for better IDE support and type safety.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
 
 
@@ -25,22 +25,22 @@ class HotkeyCombination:
             raise ValueError("Hotkey name cannot be empty")
 
 
+def _default_combinations() -> List[HotkeyCombination]:
+    """Build the default hotkey combination list."""
+    return [
+        HotkeyCombination(
+            name="record_speech",
+            keys=["ctrl", "alt"],
+            description="Press and hold to record speech, release to stop and transcribe",
+            enabled=True
+        )
+    ]
+
+
 @dataclass
 class HotkeyConfig:
     """Complete hotkey configuration."""
-    hotkey_combinations: List[HotkeyCombination] = None
-    
-    def __post_init__(self):
-        """Initialize hotkey combinations if not provided."""
-        if self.hotkey_combinations is None:
-            self.hotkey_combinations = [
-                HotkeyCombination(
-                    name="record_speech",
-                    keys=["ctrl", "alt"],
-                    description="Press and hold to record speech, release to stop and transcribe",
-                    enabled=True
-                )
-            ]
+    hotkey_combinations: List[HotkeyCombination] = field(default_factory=_default_combinations)
 
 
 # Default configuration instance
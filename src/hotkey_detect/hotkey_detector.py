@@ -7,19 +7,21 @@ record audio while keys are held, and automatically transcribe and paste
 the results when keys are released.
 """
 
-import time
+import random
+import signal
 import threading
-import keyboard
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from io import BytesIO
 
 # Import jassist modules
 from common.logging_utils import get_logger
-from recorder.record import Record
-from transcriber.transcribe import Transcriber
-from common.utils.paste_from_clipboard import paste_clipboard
 from hotkey_detect.configs.hotkey_config import config
-import pyperclip
+
+# keyboard, pyperclip and the recorder/transcriber/paste modules are
+# imported lazily inside the methods that need them - each pulls a heavy
+# transitive graph (audio stack, GUI automation) that would otherwise be
+# paid on module import
 
 # Get script directory for reliable absolute paths
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -63,10 +65,10 @@ class HotkeyDetector:
         self.min_duration = 1.25  # seconds
         
         # Initialize state variables
-        self.pressed_keys = set()
         self.is_recording = False
         self.recorder = None
         self.transcriber = None
+        self._stop = threading.Event()
         
         # Initialize components
         self.init_components()
@@ -74,38 +76,44 @@ class HotkeyDetector:
         self.logger.info("HotkeyDetector initialized")
     
     def init_components(self):
-        """Initialize recorder and transcriber components."""
+        """Initialize recorder and transcriber components.
+
+        The two constructors are independent and I/O-bound (audio device
+        probing vs. HTTP client setup), so they run concurrently and the
+        hotkey is ready after the slower of the two instead of the sum.
+        """
+        from recorder.record import Record
+        from transcriber.transcribe import Transcriber
+
         try:
-            self.recorder = Record()
-            self.transcriber = Transcriber()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                recorder_future = executor.submit(Record)
+                transcriber_future = executor.submit(Transcriber)
+                self.recorder = recorder_future.result()
+                self.transcriber = transcriber_future.result()
             self.logger.debug("Components initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize components: {e}")
             raise
     
-    def on_key_event(self, event):
-        """Handle keyboard events."""
+    def on_hotkey_pressed(self):
+        """Handle a registered hotkey combination being pressed."""
         try:
-            # Update pressed keys set
-            if event.event_type == 'down':
-                self.pressed_keys.add(event.name)
-            elif event.event_type == 'up':
-                self.pressed_keys.discard(event.name)
-            
-            # Check for active hotkey combinations
-            for hotkey in self.active_hotkeys:
-                hotkey_set = set(hotkey["keys"])
-                
-                # Start recording when hotkey is pressed
-                if hotkey_set.issubset(self.pressed_keys) and not self.is_recording:
-                    self.start_recording()
-                
-                # Stop recording when hotkey is released
-                elif self.is_recording and not hotkey_set.issubset(self.pressed_keys):
-                    self.stop_recording_and_process()
+            # add_hotkey re-fires on key auto-repeat while held
+            if not self.is_recording:
+                self.start_recording()
         except Exception as e:
-            self.logger.error(f"Error in key event handler: {e}")
-    
+            self.logger.error(f"Error in hotkey press handler: {e}")
+
+    def on_combo_key_released(self, event):
+        """Handle release of any key belonging to an active combination."""
+        try:
+            # Releasing any key of the combination breaks it
+            if self.is_recording:
+                self.stop_recording_and_process()
+        except Exception as e:
+            self.logger.error(f"Error in key release handler: {e}")
+
     def start_recording(self):
         """Start audio recording."""
         try:
@@ -137,8 +145,8 @@ class HotkeyDetector:
                 self.recorder.discard()
                 return
             
-            # Get audio bytes directly from memory instead of saving to file
-            audio_bytes = self.recorder._get_audio_bytes()
+            # Get the audio as an in-memory stream instead of saving to file
+            audio_bytes = self.recorder.get_audio_stream()
             if not audio_bytes:
                 self.logger.error("No audio data available")
                 self.recorder.discard()
@@ -158,19 +166,28 @@ class HotkeyDetector:
                 self.is_recording = False
     
     def transcribe_and_paste(self, audio_bytes):
-        """Transcribe audio and paste the result with retry logic."""
+        """Transcribe audio and paste the result with retry logic.
+
+        Failed attempts back off exponentially with jitter (1s, 2s, ...
+        capped at 8s) instead of re-firing immediately, which gives
+        transient API errors and rate limits time to clear.
+        """
+        import pyperclip
+        from common.utils.paste_from_clipboard import paste_clipboard
+
         max_retries = 3
-        
+
         for attempt in range(1, max_retries + 1):
             try:
                 self.logger.debug(f"Transcription attempt {attempt}/{max_retries}")
-                
+
                 # Transcribe the audio
                 transcription = self.transcriber.transcribe(audio_bytes)
-                
+
                 if not transcription:
                     self.logger.warning(f"Empty transcription on attempt {attempt}")
                     if attempt < max_retries:
+                        self._backoff(attempt)
                         continue
                     else:
                         self.logger.error("All transcription attempts failed")
@@ -192,33 +209,56 @@ class HotkeyDetector:
                 self.logger.error(f"Transcription attempt {attempt} failed: {e}")
                 if attempt == max_retries:
                     self.logger.error("All transcription attempts failed")
-    
+                else:
+                    self._backoff(attempt)
+
+    def _backoff(self, attempt):
+        """Sleep before the next retry: exponential with jitter, capped at 8s."""
+        delay = min(2 ** (attempt - 1) + random.random() * 0.25, 8)
+        self.logger.debug(f"Backing off {delay:.2f}s before retry")
+        time.sleep(delay)
+
     def start(self):
         """Start the hotkey detector."""
+        import keyboard
+
         try:
             self.logger.info("Starting hotkey detector")
             for hotkey in self.active_hotkeys:
                 self.logger.info(f"Listening for hotkey combination: {hotkey['name']} - {hotkey['keys']}")
             
-            # Register key event handler
-            keyboard.hook(self.on_key_event)
+            # Register each combination with the keyboard library so the
+            # matching happens in its C-backed event dispatch instead of a
+            # Python hook running on every keystroke system-wide
+            release_keys = set()
+            for hotkey in self.active_hotkeys:
+                keyboard.add_hotkey('+'.join(hotkey["keys"]), self.on_hotkey_pressed)
+                release_keys.update(hotkey["keys"])
+
+            # Stop recording when any key of a combination is released
+            for key in release_keys:
+                keyboard.on_release_key(key, self.on_combo_key_released)
             
             # Prevent the program from exiting
             self.logger.info("Hotkey detector running. Press and hold hotkey to record.")
-            
-            # Run indefinitely
-            while True:
-                try:
-                    time.sleep(1)
-                except KeyboardInterrupt:
-                    # Ignore Ctrl+C
-                    self.logger.debug("KeyboardInterrupt ignored")
-                    continue
+
+            # Stop cleanly on Ctrl+C (and Ctrl+Break on Windows) by setting
+            # the stop event from the signal handler
+            try:
+                signal.signal(signal.SIGINT, lambda *_: self._stop.set())
+                if hasattr(signal, 'SIGBREAK'):
+                    signal.signal(signal.SIGBREAK, lambda *_: self._stop.set())
+            except ValueError:
+                # Signals can only be installed from the main thread
+                self.logger.debug("Not on main thread, skipping signal handlers")
+
+            # Block until stopped - no periodic wakeups, unlike a sleep loop
+            self._stop.wait()
         except Exception as e:
             self.logger.error(f"Error in hotkey detector: {e}")
             raise
         finally:
-            # This should never execute unless there's a critical error
+            # Runs on clean shutdown (signal) or critical error
             keyboard.unhook_all()
             self.logger.info("Hotkey detector stopped")
 
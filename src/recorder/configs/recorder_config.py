@@ -5,11 +5,13 @@ This module defines the configuration for audio recording functionality.
 All configuration values use nested dataclasses for better IDE support and type safety.
 """
 
+import functools
 import os
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
+@functools.lru_cache(maxsize=1)
 def _get_default_output_directory() -> str:
     r"""
     Get the default output directory for recordings.
@@ -51,13 +53,8 @@ class OutputConfig:
     save_to_file: bool = False  # Whether to save recordings to disk
     base_filename: str = "recording"
     timestamp_format: str = "%Y%m%d_%H%M%S"
-    output_directory: str = None  # Will be set to default in __post_init__
+    output_directory: str = field(default_factory=_get_default_output_directory)
     format: str = "wav"
-    
-    def __post_init__(self):
-        """Initialize output_directory with portable default if not provided."""
-        if self.output_directory is None:
-            self.output_directory = _get_default_output_directory()
 
 
 @dataclass
@@ -69,18 +66,9 @@ class FeedbackConfig:
 @dataclass
 class RecorderConfig:
     """Complete recorder configuration combining all config sections."""
-    audio: AudioConfig = None
-    output: OutputConfig = None
-    feedback: FeedbackConfig = None
-    
-    def __post_init__(self):
-        """Initialize nested configs if not provided."""
-        if self.audio is None:
-            self.audio = AudioConfig()
-        if self.output is None:
-            self.output = OutputConfig()
-        if self.feedback is None:
-            self.feedback = FeedbackConfig()
+    audio: AudioConfig = field(default_factory=AudioConfig)
+    output: OutputConfig = field(default_factory=OutputConfig)
+    feedback: FeedbackConfig = field(default_factory=FeedbackConfig)
 
 
 # Default configuration instance
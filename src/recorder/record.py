@@ -6,10 +6,11 @@ Audio is kept in memory until explicitly saved.
 """
 
 import io
+import os
 import time
 import wave
-import queue
 import threading
+from enum import IntEnum
 import numpy as np
 import sounddevice as sd
 from datetime import datetime
@@ -22,7 +23,18 @@ from recorder.configs.recorder_config import config
 # Get script directory for reliable absolute paths
 SCRIPT_DIR = Path(__file__).resolve().parent
 
-class RecordingState:
+# The individual fields of sounddevice.CallbackFlags, checked directly
+# when decoding a status event - one attribute read per flag instead of
+# a dir() scan over the whole object
+_STATUS_FLAG_NAMES = (
+    'input_underflow',
+    'input_overflow',
+    'output_underflow',
+    'output_overflow',
+    'priming_output',
+)
+
+class RecordingState(IntEnum):
     """Enumeration for recording states."""
     STOPPED = 0
     RECORDING = 1
@@ -66,48 +78,165 @@ class Record:
         
         # Internal state
         self.state = RecordingState.STOPPED
-        self.audio_data = []
-        self.audio_queue = queue.Queue()
+        # Single flag the callback reads to decide whether to capture.
+        # Written only from the control methods (start/pause/resume/stop),
+        # read from the audio thread - a plain bool store/load is atomic
+        # under the GIL, so the real-time path needs just one attribute
+        # load instead of an enum comparison
+        self._capturing = False
+
+        # Recorded samples accumulate into one contiguous preallocated
+        # slab instead of a list of per-block arrays - no per-block
+        # allocations while recording and no concatenate copy at save
+        # time. Preallocated for 60 seconds and doubled on exhaustion
+        # (amortized O(1), like list.append).
+        self._slab = np.empty(self.sample_rate * self.channels * 60, dtype=f'int{self.bit_depth}')
+        self._n_written = 0
+
+        # Reusable buffer for in-memory WAV exports - rewound and
+        # truncated on each use so repeated save/transcribe cycles do
+        # not reallocate it
+        self._wav_buf = io.BytesIO()
+
+        # Single-producer/single-consumer ring buffer between the audio
+        # callback (producer) and the processing thread (consumer). Each
+        # side only ever writes its own index, and int stores are atomic
+        # under the GIL, so no locks are needed on the real-time path.
+        # Slots are preallocated at full block size so the callback never
+        # allocates; ~256 slots of 1024 frames is several seconds of
+        # headroom before blocks get dropped.
+        self._ring_slots = 256
+        self._ring = [
+            np.empty((self.buffer_size, self.channels), dtype=f'int{self.bit_depth}')
+            for _ in range(self._ring_slots)
+        ]
+        self._ring_frames = [0] * self._ring_slots
+        self._write_idx = 0
+        self._read_idx = 0
+        self._dropped_blocks = 0
+        self._last_status = None
+        self._consumer_stop = threading.Event()
+
         self.stream = None
         self.thread = None
         self.start_time = None
         self.paused_time = 0
         self.logger.debug("Recorder initialized with config")
     
-    def _audio_callback(self, indata, frames, time_info, status):
+    def _make_audio_callback(self):
         """
-        Callback function for sounddevice stream.
-        Queues audio data for processing.
+        Build the callback function for the sounddevice stream.
+        Publishes audio blocks into the ring buffer for the processing
+        thread - no locks and no allocation on the real-time path.
+
+        The ring structures never change after __init__, so they are
+        bound as closure locals here: the callback runs ~100 times a
+        second and each closure load replaces an attribute lookup.
         """
-        if status:
-            status_flags = ', '.join(f'{name}' for name in dir(status) if getattr(status, name) is True)
-            self.logger.warning(f"Audio callback status: {status_flags}")
-        
-        # Only queue data if we are in RECORDING state
-        if self.state == RecordingState.RECORDING:
-            self.audio_queue.put(indata.copy())
-    
+        ring = self._ring
+        ring_frames = self._ring_frames
+        ring_slots = self._ring_slots
+        copyto = np.copyto
+
+        def callback(indata, frames, time_info, status):
+            if status:
+                # Stash the flags for the worker thread to log -
+                # formatting and logging allocate and must stay off the
+                # real-time path
+                self._last_status = status
+
+            # Only publish data while actively capturing
+            if self._capturing:
+                write_idx = self._write_idx
+                if write_idx - self._read_idx >= ring_slots:
+                    # Ring is full - drop the block rather than blocking
+                    # the real-time audio thread
+                    self._dropped_blocks += 1
+                    return
+                slot = ring[write_idx % ring_slots]
+                n = len(indata)
+                copyto(slot[:n], indata)
+                ring_frames[write_idx % ring_slots] = n
+                # Publish after the slot is fully written
+                self._write_idx = write_idx + 1
+
+        return callback
+
+    def _raise_thread_priority(self):
+        """
+        Best-effort priority boost for the calling thread.
+
+        A higher priority keeps the consumer draining the ring buffer even
+        under CPU pressure, which is what prevents drop-outs. Elevated
+        scheduling usually needs privileges (SCHED_FIFO on POSIX), so any
+        failure is logged at debug level and recording continues at the
+        default priority.
+        """
+        try:
+            if os.name == 'nt':
+                import ctypes
+                # THREAD_PRIORITY_TIME_CRITICAL = 15
+                handle = ctypes.windll.kernel32.GetCurrentThread()
+                ctypes.windll.kernel32.SetThreadPriority(handle, 15)
+            else:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+            self.logger.debug("Audio processing thread priority raised")
+        except (OSError, AttributeError) as e:
+            self.logger.debug(f"Could not raise audio thread priority: {e}")
+
     def _process_audio_thread(self):
         """
-        Background thread to process audio data from the queue.
+        Background thread that consumes audio blocks from the ring buffer.
         """
+        self._raise_thread_priority()
+        # Bind loop invariants as locals - this loop competes with the
+        # audio callback for the GIL, so keep its bytecode tight
+        ring = self._ring
+        ring_frames = self._ring_frames
+        ring_slots = self._ring_slots
+        sleep = time.sleep
         try:
             while True:
-                # Get audio data from the queue
-                data = self.audio_queue.get()
-                
-                # Check if this is the termination signal
-                if data is None:
-                    break
-                
-                # Store data in our list
-                self.audio_data.append(data)
-                
-                # Mark task as done
-                self.audio_queue.task_done()
+                # Log any status flags the callback stashed
+                status = self._last_status
+                if status is not None:
+                    self._last_status = None
+                    flags = ', '.join(n for n in _STATUS_FLAG_NAMES if getattr(status, n))
+                    self.logger.warning(f"Audio callback status: {flags or status}")
+
+                read_idx = self._read_idx
+                if read_idx == self._write_idx:
+                    # Ring empty - exit once stop is signalled, otherwise
+                    # sleep briefly and poll again
+                    if self._consumer_stop.is_set():
+                        break
+                    sleep(0.002)
+                    continue
+
+                slot_idx = read_idx % ring_slots
+                n = ring_frames[slot_idx]
+                # Copy the slot into the slab, growing it if needed, then
+                # release the slot back to the producer
+                flat = ring[slot_idx][:n].reshape(-1)
+                end = self._n_written + flat.size
+                if end > self._slab.size:
+                    self._grow_slab(end)
+                self._slab[self._n_written:end] = flat
+                self._n_written = end
+                self._read_idx = read_idx + 1
         except Exception as e:
             self.logger.error(f"Error in audio processing thread: {e}")
             self.logger.debug(traceback.format_exc())
+
+    def _grow_slab(self, min_size):
+        """Double the slab until it can hold min_size samples."""
+        new_size = self._slab.size
+        while new_size < min_size:
+            new_size *= 2
+        new_slab = np.empty(new_size, dtype=self._slab.dtype)
+        new_slab[:self._n_written] = self._slab[:self._n_written]
+        self._slab = new_slab
+        self.logger.debug(f"Audio slab grown to {new_size} samples")
     
     def start(self):
         """
@@ -121,9 +250,13 @@ class Record:
             return False
         
         try:
-            # Clear any previous data
-            self.audio_data = []
-            
+            # Clear any previous data and reset the ring buffer
+            self._n_written = 0
+            self._write_idx = 0
+            self._read_idx = 0
+            self._dropped_blocks = 0
+            self._consumer_stop.clear()
+
             # Start the audio processing thread
             self.thread = threading.Thread(target=self._process_audio_thread, daemon=True)
             self.thread.start()
@@ -134,12 +267,14 @@ class Record:
                 channels=self.channels,
                 dtype=f'int{self.bit_depth}',
                 blocksize=self.buffer_size,
-                callback=self._audio_callback
+                latency='low',
+                callback=self._make_audio_callback()
             )
             self.stream.start()
             
             # Update state and time
             self.state = RecordingState.RECORDING
+            self._capturing = True
             self.start_time = time.time()
             self.paused_time = 0
             
@@ -173,6 +308,7 @@ class Record:
         try:
             # Update state
             self.state = RecordingState.PAUSED
+            self._capturing = False
             self.paused_time = time.time()
             
             # Log and show feedback
@@ -200,7 +336,8 @@ class Record:
         try:
             # Update state
             self.state = RecordingState.RECORDING
-            
+            self._capturing = True
+
             # Log and show feedback
             self.logger.info("Recording resumed")
             if self.show_status_messages:
@@ -227,19 +364,21 @@ class Record:
             # Update state
             prev_state = self.state
             self.state = RecordingState.STOPPED
-            
+            self._capturing = False
+
             # Stop the stream if it exists
-            if self.stream:
-                self.stream.stop()
-                self.stream.close()
-                self.stream = None
-            
-            # Signal the processing thread to stop and wait for it
-            self.audio_queue.put(None)
+            self._close_stream()
+
+            # Signal the processing thread to stop and wait for it to
+            # drain the remaining ring slots
+            self._consumer_stop.set()
             if self.thread and self.thread.is_alive():
                 self.thread.join(timeout=2.0)
             self.thread = None
-            
+
+            if self._dropped_blocks:
+                self.logger.warning(f"Dropped {self._dropped_blocks} audio blocks (ring buffer full)")
+
             # Log and show feedback
             action = "stopped" if prev_state == RecordingState.RECORDING else "stopped (was paused)"
             self.logger.info(f"Recording {action}")
@@ -266,7 +405,7 @@ class Record:
             dict: Result with status, message, and file_path if successful
         """
         # Check if we have audio data
-        if not self.audio_data:
+        if not self._n_written:
             self.logger.warning("Cannot save: no audio data available")
             return {
                 "status": "error",
@@ -289,22 +428,19 @@ class Record:
             
             file_path = output_dir / filename
             
-            # Convert audio data to bytes
-            audio_bytes = self._get_audio_bytes()
-            
-            # Save to file
+            # Stream the WAV frames straight to disk - no intermediate
+            # in-memory copy of the whole recording
             with open(file_path, "wb") as f:
-                f.write(audio_bytes.getbuffer())
-            
+                self._write_wav(f)
+
             self.logger.info(f"Recording saved to {file_path}")
             if self.show_status_messages:
                 print(f"Recording saved to {file_path}")
-            
+
             return {
                 "status": "success",
                 "message": f"Recording saved to {file_path}",
-                "file_path": str(file_path),
-                "audio_bytes": audio_bytes
+                "file_path": str(file_path)
             }
         except Exception as e:
             self.logger.error(f"Failed to save recording: {e}")
@@ -322,9 +458,9 @@ class Record:
             bool: True if discarded successfully
         """
         try:
-            # Clear audio data
-            self.audio_data = []
-            
+            # Clear audio data (the slab itself is kept for reuse)
+            self._n_written = 0
+
             # Clean up resources
             self._cleanup()
             
@@ -345,13 +481,24 @@ class Record:
         Returns:
             float: Recording duration in seconds
         """
-        if not self.audio_data:
-            return 0.0
-        
         # Calculate from number of frames and sample rate
-        total_frames = sum(len(chunk) for chunk in self.audio_data)
+        total_frames = self._n_written // self.channels
         return total_frames / self.sample_rate
     
+    def get_audio_stream(self):
+        """
+        Get the recorded audio as a file-like WAV stream.
+
+        Public accessor for consumers (e.g. the transcriber) that accept a
+        binary stream - no extra bytes object is materialized beyond the
+        in-memory WAV buffer itself. The buffer is reused across calls,
+        so consume it before the next recording rather than retaining it.
+
+        Returns:
+            io.BytesIO: WAV audio stream positioned at the start
+        """
+        return self._get_audio_bytes()
+
     def _get_audio_bytes(self):
         """
         Convert the recorded audio data to WAV format in a BytesIO object.
@@ -359,40 +506,80 @@ class Record:
         Returns:
             io.BytesIO: BytesIO object containing the WAV audio data
         """
-        # Create a memory buffer for the WAV file
-        wav_buffer = io.BytesIO()
-        
-        # Concatenate all audio chunks
-        if self.audio_data:
-            all_audio = np.concatenate(self.audio_data)
-            
-            # Create WAV file in memory
-            with wave.open(wav_buffer, 'wb') as wav_file:
-                wav_file.setnchannels(self.channels)
-                wav_file.setsampwidth(self.bit_depth // 8)
-                wav_file.setframerate(self.sample_rate)
-                wav_file.writeframes(all_audio.tobytes())
-        
+        # Reuse the instance buffer across exports - the underlying
+        # allocation survives the truncate, so repeated
+        # record/transcribe cycles stop paying a fresh BytesIO each time
+        wav_buffer = self._wav_buf
+        wav_buffer.seek(0)
+        wav_buffer.truncate(0)
+        if self._n_written:
+            self._write_wav(wav_buffer)
+
         # Reset buffer position for reading
         wav_buffer.seek(0)
         return wav_buffer
+
+    def _write_wav(self, fileobj):
+        """
+        Write the recorded audio as WAV to an open binary file object.
+
+        The slab is already one contiguous int16 buffer, so the frames go
+        out in a single pass - no concatenate, no tobytes copy
+        (writeframes accepts any buffer object).
+
+        Args:
+            fileobj: Binary file-like object opened for writing
+        """
+        with wave.open(fileobj, 'wb') as wav_file:
+            wav_file.setnchannels(self.channels)
+            wav_file.setsampwidth(self.bit_depth // 8)
+            wav_file.setframerate(self.sample_rate)
+            # The frame count is known up front, so declare it and use
+            # writeframesraw: the header goes out correct on the first
+            # write and wave.py skips its tell()/seek() patch pass at
+            # close
+            wav_file.setnframes(self._n_written // self.channels)
+            wav_file.writeframesraw(self._slab[:self._n_written])
     
+    def _close_stream(self, abort=False):
+        """
+        Stop and close the input stream if it is open.
+
+        Setting self.stream to None first makes a second call (e.g.
+        stop() followed by _cleanup() on an error path) a no-op instead
+        of stopping the same stream twice.
+
+        Args:
+            abort (bool): If True, abort the stream (discard any buffered
+                frames and return immediately) instead of stopping it,
+                which drains the PortAudio buffer first.
+        """
+        stream = self.stream
+        if stream is None:
+            return
+        self.stream = None
+        if abort:
+            stream.abort()
+        else:
+            stream.stop()
+        stream.close()
+
     def _cleanup(self):
         """Clean up resources."""
         try:
-            # Stop the stream if it exists
-            if self.stream:
-                self.stream.stop()
-                self.stream.close()
-                self.stream = None
-            
+            # Abort rather than drain - cleanup runs when the recording
+            # is being discarded or something already went wrong, so the
+            # buffered frames are not needed
+            self._close_stream(abort=True)
+
             # Signal the processing thread to stop if it exists
             if self.thread and self.thread.is_alive():
-                self.audio_queue.put(None)
+                self._consumer_stop.set()
                 self.thread.join(timeout=1.0)
                 self.thread = None
             
             # Update state
             self.state = RecordingState.STOPPED
+            self._capturing = False
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}")
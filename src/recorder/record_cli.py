@@ -6,7 +6,6 @@ Provides a simple CLI for recording, pausing, and saving audio.
 
 import os
 import sys
-import time
 import argparse
 import threading
 import keyboard
@@ -14,7 +13,7 @@ import traceback
 from pathlib import Path
 
 # Import the Record class from the package
-from recorder.record import Record
+from recorder.record import Record, RecordingState
 from common.logging_utils import get_logger
 
 # Set up logger for this module
@@ -43,6 +42,7 @@ class RecorderCLI:
         self.recording_thread = None
         self.is_running = False
         self.custom_filename = None
+        self._exit_event = threading.Event()
     
     def start_recording(self, custom_filename=None):
         """Start recording audio."""
@@ -79,10 +79,10 @@ class RecorderCLI:
             if not self.is_running:
                 return
                 
-            if self.recorder.state == 1:  # RECORDING
+            if self.recorder.state == RecordingState.RECORDING:
                 if self.recorder.pause():
                     print("Recording paused. Press ctrl+space to resume.")
-            elif self.recorder.state == 2:  # PAUSED
+            elif self.recorder.state == RecordingState.PAUSED:
                 if self.recorder.resume():
                     print("Recording resumed.")
         except Exception as e:
@@ -115,7 +115,7 @@ class RecorderCLI:
         """Save the recording to a file."""
         try:
             # If still recording, stop first
-            if self.recorder.state != 0:  # Not STOPPED
+            if self.recorder.state != RecordingState.STOPPED:
                 self.stop_recording()
             
             # Save the recording
@@ -123,8 +123,9 @@ class RecorderCLI:
             
             if result["status"] == "success":
                 print(f"Recording saved to: {result['file_path']}")
-                # Clean up and exit
+                # Clean up and release the main thread
                 self.cleanup()
+                self._exit_event.set()
                 sys.exit(0)
             else:
                 print(f"Failed to save recording: {result['message']}")
@@ -138,13 +139,14 @@ class RecorderCLI:
         """Discard the recording without saving."""
         try:
             # If still recording, stop first
-            if self.recorder.state != 0:  # Not STOPPED
+            if self.recorder.state != RecordingState.STOPPED:
                 self.stop_recording()
             
             if self.recorder.discard():
                 print("Recording discarded.")
-                # Clean up and exit
+                # Clean up and release the main thread
                 self.cleanup()
+                self._exit_event.set()
                 sys.exit(0)
             else:
                 print("Failed to discard recording.")
@@ -173,14 +175,14 @@ class RecorderCLI:
             self.start_recording(custom_filename)
             
             print("\nRecording... Press Ctrl+C to exit completely")
-            
-            # Keep the main thread alive to process keyboard events
+
+            # Block until a save/discard handler signals exit - no
+            # periodic wakeups, unlike a sleep loop
             try:
-                while True:
-                    time.sleep(0.1)
+                self._exit_event.wait()
             except KeyboardInterrupt:
                 print("\nExiting...")
-                if self.recorder.state != 0:  # Not STOPPED
+                if self.recorder.state != RecordingState.STOPPED:
                     self.stop_recording()
                 self.cleanup()
         except Exception as e:
@@ -13,7 +13,15 @@ from dataclasses import dataclass
 from typing import Literal
 
 
-@dataclass
+# Environment overrides are read once at import time (priority 1) - the
+# environment does not change mid-run, so per-instance os.environ lookups
+# in __post_init__ would be wasted. Note: .env file loading would happen
+# here if implemented (priority 2). Default values below are priority 3.
+_ENV_LANGUAGE = os.environ.get("TRANSCRIBE_LANGUAGE")
+_ENV_MODEL = os.environ.get("TRANSCRIBE_MODEL")
+
+
+@dataclass(slots=True)
 class TranscribeConfig:
     """
     Configuration for OpenAI Whisper API transcription.
@@ -27,28 +35,13 @@ class TranscribeConfig:
         temperature: Sampling temperature (0.0 to 1.0)
         response_format: Format of the response ('text' or 'json')
     """
-    model: str = "whisper-1"
+    model: str = _ENV_MODEL if _ENV_MODEL is not None else "whisper-1"
     timeout: int = 30
     max_retries: int = 3
-    language: str = "en"
+    language: str = _ENV_LANGUAGE if _ENV_LANGUAGE is not None else "en"
     prompt: str = ""
     temperature: float = 0.0
     response_format: Literal["text", "json"] = "text"
-    
-    def __post_init__(self):
-        """Load configuration from environment variables if available."""
-        # Load language from environment variable (priority 1)
-        env_language = os.environ.get("TRANSCRIBE_LANGUAGE")
-        if env_language is not None:
-            self.language = env_language
-        
-        # Load model from environment variable (priority 1)
-        env_model = os.environ.get("TRANSCRIBE_MODEL")
-        if env_model is not None:
-            self.model = env_model
-        
-        # Note: .env file loading would happen here if implemented (priority 2)
-        # Default values from dataclass fields are priority 3
 
 
 # Default configuration instance
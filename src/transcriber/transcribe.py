@@ -1,8 +1,30 @@
+import json
+import logging
 import os
+import random
+import threading
 import time
+import traceback
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 
+# Optional streaming multipart encoder - requests itself buffers the
+# whole multipart body in memory before sending, the toolbelt encoder
+# streams it in chunks
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+    TOOLBELT_AVAILABLE = True
+except ImportError:
+    TOOLBELT_AVAILABLE = False
+
+# Optional C-backed JSON codec - stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import from package
 from common.logging_utils import get_logger
 from transcriber.configs.transcribe_config import config
@@ -10,6 +32,15 @@ from transcriber.configs.transcribe_config import config
 # Get script directory for reliable absolute paths
 SCRIPT_DIR = Path(__file__).resolve().parent
 
+# Project-root runtime config written by the dashboard/settings CLI.
+# SCRIPT_DIR is already resolved, so no per-call resolve() is needed
+RUNTIME_CONFIG_PATH = SCRIPT_DIR.parent.parent / "runtime_config.json"
+
+# HTTP statuses worth retrying - rate limiting and transient server
+# errors. Other 4xx responses are terminal; retrying them just burns the
+# retry budget
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
 class Transcriber:
     """
     Handles transcription using OpenAI Whisper API and pastes the result at the cursor.
@@ -32,35 +63,129 @@ class Transcriber:
             self.logger.error(error_msg)
             raise EnvironmentError(error_msg)
         
+        # One HTTP session for the lifetime of the transcriber: keep-alive
+        # reuses the TCP+TLS connection to api.openai.com across retries
+        # and successive transcriptions instead of paying a fresh
+        # handshake per request, and the auth header is set once here
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        self.session.headers.update({"Authorization": f"Bearer {self.api_key}"})
+
+        # Warm up a pooled connection in the background so the first
+        # transcription reuses a hot socket instead of paying the
+        # TCP+TLS handshake inline
+        threading.Thread(target=self._prewarm_connection, daemon=True).start()
+
+        # Parsed runtime_config.json cached against its mtime, so
+        # back-to-back transcriptions skip the open+parse unless the
+        # dashboard actually rewrote the file
+        self._rt_cfg = None
+        self._rt_mtime = None
+
+        # Multipart form fields memoized against the runtime-config
+        # mtime - they only change when the file does
+        self._form_fields = None
+        self._form_mtime = None
+
+        # Per-instance parameter overrides (e.g. CLI flags) - consulted
+        # after runtime_config.json, so they win over both the file and
+        # the dataclass defaults
+        self.overrides = {}
+
+        # Debug-audio capture flag and target directory resolved once -
+        # the environment does not change mid-run, so there is no point
+        # in two os.getenv calls per transcription
+        self._debug_audio_enabled = bool(os.getenv('SAVE_DEBUG_AUDIO') or os.getenv('DEBUG_MODE'))
+        self._debug_audio_dir = SCRIPT_DIR.parent / "tests"
+
         # Dynamic config values (model, language, temperature, prompt, response_format)
         # will be read fresh from config on each transcribe() call
         self.logger.debug("Transcriber initialized (dynamic config values will be read on each transcription)")
 
+    def close(self):
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def _prewarm_connection(self):
+        """
+        Prime a pooled connection to the API host with a cheap GET.
+        Best-effort only - any failure just means the first real request
+        opens the connection itself, as before.
+        """
+        try:
+            self.session.get("https://api.openai.com/v1/models", timeout=5)
+            self.logger.debug("API connection pre-warmed")
+        except Exception as e:
+            self.logger.debug(f"Connection pre-warm failed (ignored): {e}")
+
+    def set_overrides(self, **overrides):
+        """
+        Set per-instance parameter overrides (model, language, prompt,
+        temperature). None values are ignored; the rest take precedence
+        over runtime_config.json and the dataclass defaults.
+        """
+        self.overrides.update({key: value for key, value in overrides.items() if value is not None})
+        # Drop the memoized form fields so the next call picks these up
+        self._form_fields = None
+
+    def _load_runtime_config(self, path):
+        """
+        Read runtime_config.json, reparsing only when its mtime changes.
+
+        Returns:
+            dict or None: Parsed config, or None when the file does not exist
+        """
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            self._rt_cfg = None
+            self._rt_mtime = None
+            return None
+
+        if mtime != self._rt_mtime:
+            if ORJSON_AVAILABLE:
+                self._rt_cfg = orjson.loads(path.read_bytes())
+            else:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._rt_cfg = json.load(f)
+            self._rt_mtime = mtime
+            self.logger.debug(f"Loaded runtime config from {path}")
+        return self._rt_cfg
+
     def transcribe(self, audio_bytes):
         """
         Send audio (WAV bytes) to OpenAI Whisper and return the transcription.
         Handles both text and json response formats.
         """
         url = "https://api.openai.com/v1/audio/transcriptions"
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        
+
         # Verify audio bytes
         if not audio_bytes:
             self.logger.error("No audio data received for transcription")
             return ""
             
-        # Log audio data details
-        buffer_size = audio_bytes.getbuffer().nbytes
-        self.logger.debug(f"Audio data size: {buffer_size} bytes ({buffer_size/1024:.2f} KB)")
-        
+        # Log audio data details - measured with seek/tell so any
+        # file-like stream works, not just BytesIO. The probe only runs
+        # when DEBUG is on; its result feeds nothing else
+        if self.logger.isEnabledFor(logging.DEBUG):
+            audio_bytes.seek(0, os.SEEK_END)
+            buffer_size = audio_bytes.tell()
+            self.logger.debug(f"Audio data size: {buffer_size} bytes ({buffer_size/1024:.2f} KB)")
+
         # Reset the buffer position for the request
         audio_bytes.seek(0)
         
         # Save a copy of the audio being sent to API for debugging (only if enabled)
-        if os.getenv('SAVE_DEBUG_AUDIO') or os.getenv('DEBUG_MODE'):
+        if self._debug_audio_enabled:
             try:
                 timestamp = time.strftime("%Y%m%d-%H%M%S")
-                output_dir = Path(SCRIPT_DIR).parent / "tests"
+                output_dir = self._debug_audio_dir
                 output_dir.mkdir(exist_ok=True)
                 debug_file = output_dir / f"openai_request_{timestamp}.wav"
                 with open(debug_file, 'wb') as f:
@@ -75,103 +200,146 @@ class Transcriber:
         # This allows runtime configuration changes without restarting the application
         cfg = config
         
-        # Try to read from runtime config file if it exists
-        runtime_config_path = Path(__file__).resolve().parent.parent.parent / "runtime_config.json"
-        print(f"\n[CONFIG] Looking for runtime config at: {runtime_config_path}")
-        self.logger.debug(f"Looking for runtime config at: {runtime_config_path}")
-        
-        if runtime_config_path.exists():
-            try:
-                import json
-                with open(runtime_config_path, 'r', encoding='utf-8') as f:
-                    runtime_cfg = json.load(f)
-                model = runtime_cfg.get("transcription", {}).get("model", cfg.model)
-                language = runtime_cfg.get("transcription", {}).get("language", cfg.language)
-                print(f"[CONFIG] Runtime config loaded successfully")
-                print(f"[CONFIG] Language: {language}")
-                print(f"[CONFIG] Model: {model}")
-                self.logger.debug(f"Loaded runtime config from {runtime_config_path}")
-                self.logger.debug(f"Runtime config values - language: {language}, model: {model}")
-            except Exception as e:
-                print(f"[CONFIG] ERROR: Failed to read runtime config: {e}")
-                print(f"[CONFIG] Using default values - language: {cfg.language}, model: {cfg.model}")
-                self.logger.warning(f"Failed to read runtime config, using defaults: {e}")
-                model = cfg.model
-                language = cfg.language
-        else:
-            print(f"[CONFIG] Runtime config file not found")
-            print(f"[CONFIG] Using default values - language: {cfg.language}, model: {cfg.model}")
-            model = cfg.model
-            language = cfg.language
-        
+        # Try to read from runtime config file if it exists - the parsed
+        # dict is cached against the file's mtime, so this is a single
+        # stat() on the hot path unless the file changed
+        model = cfg.model
+        language = cfg.language
+        try:
+            runtime_cfg = self._load_runtime_config(RUNTIME_CONFIG_PATH)
+        except Exception as e:
+            self.logger.warning(f"Failed to read runtime config, using defaults: {e}")
+            runtime_cfg = None
+
+        if runtime_cfg is not None:
+            transcription_cfg = runtime_cfg.get("transcription", {})
+            model = transcription_cfg.get("model", model)
+            language = transcription_cfg.get("language", language)
+            self.logger.debug(f"Runtime config values - language: {language}, model: {model}")
+
+        # Explicit overrides (CLI flags) win over everything above
+        overrides = self.overrides
+        if overrides:
+            model = overrides.get("model", model)
+            language = overrides.get("language", language)
+
         # Other config values from dataclass
-        prompt = cfg.prompt
-        temperature = cfg.temperature
         response_format = cfg.response_format
-        
+
         self.logger.debug(f"Reading config dynamically - model: {model}, language: {language}")
+
+        # Rebuild the form fields only when the runtime config moved -
+        # between config changes every call (and every retry) reuses the
+        # same dict
+        if self._form_fields is None or self._form_mtime != self._rt_mtime:
+            self._form_fields = {
+                "model": model,
+                "language": language,
+                "prompt": overrides.get("prompt", cfg.prompt),
+                "temperature": overrides.get("temperature", cfg.temperature),
+                "response_format": response_format,
+            }
+            self._form_mtime = self._rt_mtime
+        data = self._form_fields
         
-        data = {
-            "model": model,
-            "language": language,
-            "prompt": prompt,
-            "temperature": temperature,
-            "response_format": response_format,
-        }
-        
-        print(f"[API] Preparing request to OpenAI Whisper API")
-        print(f"[API] Language parameter: '{language}'")
-        print(f"[API] Model parameter: '{model}'")
-        
-        self.logger.debug(f"API request details:")
-        self.logger.debug(f"URL: {url}")
-        self.logger.debug(f"Headers: Authorization: Bearer ****{self.api_key[-4:] if self.api_key else ''}")
-        self.logger.debug(f"Files: audio.wav (audio/wav)")
-        self.logger.debug(f"Data parameters: {data}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("API request details:")
+            self.logger.debug("URL: %s", url)
+            self.logger.debug("Headers: Authorization: Bearer ****%s", self.api_key[-4:])
+            self.logger.debug("Files: audio.wav (audio/wav)")
+            self.logger.debug("Data parameters: %s", data)
         
+        # The file tuple is immutable across retries - only the stream
+        # position needs rewinding per attempt
+        files = {
+            "file": ("audio.wav", audio_bytes, "audio/wav"),
+        }
+
         for attempt in range(1, self.max_retries + 1):
             try:
-                self.logger.debug(f"Sending audio to OpenAI (attempt {attempt})...")
-                print(f"Sending audio to OpenAI (attempt {attempt}/{self.max_retries})...")
-                
-                # Create a fresh file object for each attempt to prevent file position issues
+                self.logger.debug(f"Sending audio to OpenAI (attempt {attempt}/{self.max_retries})...")
+
+                # Rewind the audio stream for this attempt
                 audio_bytes.seek(0)
-                files = {
-                    "file": ("audio.wav", audio_bytes, "audio/wav"),
-                }
-                
-                response = requests.post(url, headers=headers, files=files, data=data, timeout=self.timeout)
+
+                if TOOLBELT_AVAILABLE:
+                    # Stream the body in chunks - memory stays flat no
+                    # matter how long the recording is. The encoder is
+                    # single-use, so it is rebuilt per attempt
+                    encoder = MultipartEncoder(fields={
+                        **{key: str(value) for key, value in data.items()},
+                        "file": ("audio.wav", audio_bytes, "audio/wav"),
+                    })
+                    response = self.session.post(
+                        url,
+                        data=encoder,
+                        headers={"Content-Type": encoder.content_type},
+                        timeout=self.timeout,
+                    )
+                else:
+                    response = self.session.post(url, files=files, data=data, timeout=self.timeout)
                 
-                self.logger.debug(f"Response status code: {response.status_code}")
-                self.logger.debug(f"Response headers: {dict(response.headers)}")
+                # Lazy %s formatting - headers are only stringified when
+                # DEBUG is actually enabled, and without the dict() copy
+                self.logger.debug("Response status code: %s", response.status_code)
+                self.logger.debug("Response headers: %s", response.headers)
                 
                 # Check for HTTP errors
                 if response.status_code != 200:
                     self.logger.error(f"API error - Status code: {response.status_code}")
                     self.logger.error(f"API response: {response.text}")
                     print(f"Error from OpenAI API: {response.status_code} - {response.text}")
-                    if attempt == self.max_retries:
+                    if response.status_code not in _RETRYABLE_STATUSES or attempt == self.max_retries:
                         return ""
+                    self._backoff(attempt, response.headers.get("Retry-After"))
                     continue
                 
-                # Log the full raw response for debugging
-                self.logger.debug(f"Raw API response: {response.text}")
-                
+                # Log the full raw response for debugging - response.text
+                # decodes the body, so only pay for it when DEBUG is on
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Raw API response: %s", response.text)
+
                 if response_format == "json":
-                    result = response.json()
+                    # Parse the raw bytes directly - skips response.json()'s
+                    # encoding detection and the slower stdlib decoder
+                    if ORJSON_AVAILABLE:
+                        result = orjson.loads(response.content)
+                    else:
+                        result = response.json()
                     text = result.get("text", "")
-                    self.logger.debug(f"Parsed JSON response: {result}")
+                    self.logger.debug("Parsed JSON response: %s", result)
                     self.logger.info(f"Transcription result: {text}")
                 else:
                     text = response.text
                     self.logger.info(f"Transcription result: {text}")
                 
                 return text.strip()
-            except Exception as e:
-                self.logger.error(f"Transcription attempt {attempt} failed: {e}")
-                import traceback
-                self.logger.error(traceback.format_exc())
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                # Network-level failures are transient - back off and retry.
+                # Anything else (bad payload, parse errors) propagates
+                # immediately rather than wasting the retry budget
+                self.logger.error(f"Transcription attempt {attempt} failed: {e!r}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.error(traceback.format_exc())
                 if attempt == self.max_retries:
                     print(f"Failed to transcribe after {self.max_retries} attempts: {e}")
                     raise
+                self._backoff(attempt)
         return ""
+
+    def _backoff(self, attempt, retry_after=None):
+        """
+        Sleep before the next retry: full-jitter exponential, capped at 8s.
+
+        Immediate re-posts against a rate-limited or failing API just
+        invite more throttling. A Retry-After header value, when given,
+        is honored as the lower bound.
+        """
+        delay = random.uniform(0, min(2 ** (attempt - 1), 8))
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+        self.logger.debug(f"Backing off {delay:.2f}s before retry")
+        time.sleep(delay)
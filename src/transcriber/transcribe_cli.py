@@ -1,7 +1,13 @@
 import argparse
 import io
+import mmap
 import os
+import shutil
+import subprocess
 import sys
+import traceback
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Import from package
@@ -18,6 +24,13 @@ except ImportError:
 # Supported audio formats
 SUPPORTED_FORMATS = {'.wav', '.mp3', '.aac', '.m4a'}
 
+# WAV header validation results keyed by (path, st_mtime_ns), so batch
+# runs over the same files skip repeat header reads
+_VALIDATION_CACHE = {}
+
+# ffmpeg binary located once at import; None if not installed
+_FFMPEG = shutil.which('ffmpeg')
+
 def parse_arguments():
     """Parse command line arguments for the transcription CLI."""
     parser = argparse.ArgumentParser(
@@ -25,14 +38,22 @@ def parse_arguments():
     )
     
     parser.add_argument(
-        "--input", "-i", 
+        "--input", "-i",
         required=True,
-        help="Path to the input audio file (supported formats: WAV, MP3, AAC, M4A)"
+        nargs='+',
+        help="Path(s) to the input audio file(s) (supported formats: WAV, MP3, AAC, M4A)"
     )
-    
+
     parser.add_argument(
         "--output", "-o",
-        help="Path to save the transcription output (default: input_filename.txt)"
+        help="Path to save the transcription output (default: input_filename.txt; single input only)"
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of files to transcribe in parallel (default: 4)"
     )
     
     parser.add_argument(
@@ -67,11 +88,59 @@ def parse_arguments():
         action="store_true",
         help="Disable automatic conversion from non-WAV formats to WAV"
     )
+
+    parser.add_argument(
+        "--keep-format",
+        action="store_true",
+        help="Upload the source sample rate/channels instead of downmixing to 16 kHz mono"
+    )
     
     return parser.parse_args()
 
-def convert_to_wav(file_path, logger):
-    """Convert audio file to WAV format using pydub."""
+def _convert_with_ffmpeg(file_path, keep_format=False):
+    """
+    Decode an audio file to in-memory WAV with a single ffmpeg process.
+
+    pydub spawns ffmpeg through temp files per conversion; piping
+    straight to stdout does decode, resample, and WAV mux in one
+    process with no disk round-trip.
+
+    Returns:
+        io.BytesIO: WAV data positioned at the start
+
+    Raises:
+        RuntimeError: If ffmpeg exits non-zero
+    """
+    cmd = [_FFMPEG, "-hide_banner", "-loglevel", "error", "-i", str(file_path)]
+    if not keep_format:
+        cmd += ["-ar", "16000", "-ac", "1", "-sample_fmt", "s16"]
+    cmd += ["-f", "wav", "pipe:1"]
+
+    result = subprocess.run(cmd, capture_output=True)
+    if result.returncode != 0:
+        stderr = result.stderr.decode('utf-8', errors='replace').strip()
+        raise RuntimeError(stderr or f"ffmpeg exited with code {result.returncode}")
+    return io.BytesIO(result.stdout)
+
+
+def convert_to_wav(file_path, logger, keep_format=False):
+    """
+    Convert audio file to WAV format - directly via ffmpeg when it is
+    on PATH, otherwise through pydub.
+
+    Unless keep_format is set, the audio is also downmixed to 16 kHz
+    mono 16-bit - what Whisper works with anyway - which cuts upload
+    size several-fold for typical 44.1 kHz stereo sources.
+    """
+    if _FFMPEG:
+        try:
+            wav_data = _convert_with_ffmpeg(file_path, keep_format)
+            logger.debug(f"Converted {file_path} via ffmpeg pipe "
+                         f"(size: {wav_data.getbuffer().nbytes} bytes)")
+            return wav_data
+        except Exception as e:
+            logger.warning(f"Direct ffmpeg conversion failed, falling back to pydub: {e}")
+
     if not PYDUB_AVAILABLE:
         logger.error("pydub is not installed. Cannot convert audio formats.")
         print("Error: pydub is required for audio format conversion.")
@@ -92,6 +161,9 @@ def convert_to_wav(file_path, logger):
             # For other formats, let pydub try to figure it out
             audio = AudioSegment.from_file(file_path)
         
+        if not keep_format:
+            audio = audio.set_frame_rate(16000).set_channels(1).set_sample_width(2)
+
         # Convert to WAV (in memory)
         wav_data = io.BytesIO()
         audio.export(wav_data, format="wav")
@@ -101,25 +173,49 @@ def convert_to_wav(file_path, logger):
         return wav_data
     except Exception as e:
         logger.error(f"Failed to convert audio format: {e}")
-        import traceback
         logger.error(traceback.format_exc())
         raise
 
-def read_audio_file(file_path, convert=True, logger=None):
+def _wav_needs_downmix(file_path):
+    """Return True when a WAV file is not already 16 kHz mono 16-bit."""
+    try:
+        with wave.open(str(file_path), 'rb') as wav_file:
+            return (wav_file.getframerate(), wav_file.getnchannels(),
+                    wav_file.getsampwidth()) != (16000, 1, 2)
+    except (wave.Error, EOFError):
+        # Unreadable header - send the file as-is and let the API decide
+        return False
+
+
+def read_audio_file(file_path, convert=True, logger=None, keep_format=False):
     """
     Read an audio file into a BytesIO object.
     If the file is not WAV and convert=True, automatically convert it to WAV.
+    WAV files above 16 kHz mono are downmixed too (unless keep_format),
+    since shipping the source rate just inflates the upload.
     """
     try:
         # Check if conversion is needed
         if convert and file_path.suffix.lower() != '.wav':
             logger.debug(f"Non-WAV format detected, converting to WAV: {file_path}")
-            return convert_to_wav(file_path, logger)
+            return convert_to_wav(file_path, logger, keep_format)
+        elif (convert and not keep_format and (_FFMPEG or PYDUB_AVAILABLE)
+                and _wav_needs_downmix(file_path)):
+            logger.debug(f"WAV file is not 16 kHz mono, downmixing: {file_path}")
+            return convert_to_wav(file_path, logger, keep_format)
         else:
-            # Just read the file as binary
-            with open(file_path, "rb") as f:
-                audio_bytes = io.BytesIO(f.read())
-            return audio_bytes
+            # Memory-map the file instead of copying it into a BytesIO -
+            # the OS page cache backs the mapping, so peak RSS stays
+            # flat for large files. The mapping is file-like (read/seek/
+            # tell), which is all the uploader needs
+            try:
+                with open(file_path, "rb") as f:
+                    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty file or platform without mmap support for this
+                # handle - fall back to an in-memory copy
+                with open(file_path, "rb") as f:
+                    return io.BytesIO(f.read())
     except Exception as e:
         if logger:
             logger.error(f"Failed to read audio file: {e}")
@@ -142,114 +238,158 @@ def validate_audio_format(file_path, force=False):
     # Basic validation for WAV files
     if file_ext == '.wav':
         try:
-            with open(file_path, 'rb') as f:
-                header = f.read(12)
-                # Check for RIFF header and WAVE format
-                if header[0:4] != b'RIFF' or header[8:12] != b'WAVE':
-                    return False
+            cache_key = (str(file_path), file_path.stat().st_mtime_ns)
+            cached = _VALIDATION_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # Raw fd read - one open/read/close without the buffered-IO
+            # machinery, since only 12 header bytes are needed. O_BINARY
+            # keeps the read byte-exact on Windows, where os.open
+            # defaults to text mode
+            fd = os.open(str(file_path), os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                header = os.read(fd, 12)
+            finally:
+                os.close(fd)
+
+            # Check for RIFF header and WAVE format
+            valid = header[0:4] == b'RIFF' and header[8:12] == b'WAVE'
+            _VALIDATION_CACHE[cache_key] = valid
+            return valid
         except Exception:
             return False
-    
+
     # For other formats, we'll let pydub handle validation during conversion
     return True
 
-def main():
-    """Main function to handle the CLI transcription process."""
-    # Parse command line arguments
-    args = parse_arguments()
-    
-    # Set up logger
-    global logger
-    logger = get_logger("transcribe_cli")
-    logger.debug(f"Starting CLI transcription with arguments: {args}")
-    
-    # Convert input path to absolute path
-    input_path = Path(args.input).resolve()
-    logger.debug(f"Input file: {input_path}")
-    
-    # Check if input file exists
-    if not input_path.exists():
-        logger.error(f"Input file not found: {input_path}")
-        print(f"Error: Input file not found: {input_path}")
-        sys.exit(1)
-    
-    # Check if pydub is available for conversion
-    if not PYDUB_AVAILABLE and input_path.suffix.lower() != '.wav' and not args.no_convert:
-        logger.warning("pydub is not installed but non-WAV format detected.")
-        print("Warning: pydub is not installed for audio format conversion.")
-        print("Attempting to process the file directly, which may not work with the OpenAI API.")
-    
-    # Validate file format
-    if not validate_audio_format(input_path, args.force):
-        logger.error(f"Unsupported audio format: {input_path}")
-        print(f"Error: Unsupported audio format: {input_path}")
-        print(f"Supported formats: {', '.join(SUPPORTED_FORMATS)}")
-        print("Use --force to attempt processing this file anyway (may not work with OpenAI API)")
-        sys.exit(1)
-    
-    # Determine output file path
-    if args.output:
-        output_path = Path(args.output).resolve()
-    else:
-        # Default to input filename with .txt extension
-        output_path = input_path.with_suffix(".txt")
-    logger.debug(f"Output file: {output_path}")
-    
+def process_file(transcriber, input_path, output_path, args, logger):
+    """
+    Read, transcribe, and save a single audio file.
+
+    Returns:
+        bool: True on success, False otherwise
+    """
     try:
-        # Initialize transcriber
-        transcriber = Transcriber()
-        logger.debug("Transcriber initialized")
-        
-        # Override config settings if provided in arguments
-        if args.language:
-            transcriber.language = args.language
-            logger.debug(f"Language override: {args.language}")
-        
-        if args.model:
-            transcriber.model = args.model
-            logger.debug(f"Model override: {args.model}")
-        
-        if args.temperature is not None:
-            transcriber.temperature = args.temperature
-            logger.debug(f"Temperature override: {args.temperature}")
-            
-        if args.prompt:
-            transcriber.prompt = args.prompt
-            logger.debug(f"Prompt override: {args.prompt}")
-        
         # Read audio file (with auto-conversion if needed)
         print(f"Reading audio file: {input_path}")
-        audio_bytes = read_audio_file(input_path, 
-                                     convert=not args.no_convert and input_path.suffix.lower() != '.wav',
-                                     logger=logger)
-        
+        audio_bytes = read_audio_file(input_path,
+                                     convert=not args.no_convert,
+                                     logger=logger,
+                                     keep_format=args.keep_format)
+
         # Transcribe audio
-        print(f"Transcribing audio using OpenAI Whisper API (model: {transcriber.model})...")
+        print(f"Transcribing audio using OpenAI Whisper API: {input_path.name}")
         result = transcriber.transcribe(audio_bytes)
-        
+
         if not result:
-            logger.error("Transcription failed or returned empty result")
-            print("Error: Transcription failed or returned empty result")
-            sys.exit(1)
-        
+            logger.error(f"Transcription failed or returned empty result: {input_path}")
+            print(f"Error: Transcription failed or returned empty result: {input_path}")
+            return False
+
         # Display the transcription result
-        print("\nTranscription result:")
+        print(f"\nTranscription result ({input_path.name}):")
         print("-" * 40)
         print(result)
         print("-" * 40)
-        
+
         # Save to output file
         print(f"Saving transcription to: {output_path}")
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_path, "w", encoding="utf-8") as f:
             f.write(result)
-        
+
         logger.info(f"Transcription completed and saved to {output_path}")
+        return True
+    except Exception as e:
+        logger.error(f"Transcription process failed for {input_path}: {e}")
+        logger.error(traceback.format_exc())
+        print(f"Error processing {input_path}: {e}")
+        return False
+
+
+def main():
+    """Main function to handle the CLI transcription process."""
+    # Parse command line arguments
+    args = parse_arguments()
+
+    # Set up logger
+    global logger
+    logger = get_logger("transcribe_cli")
+    logger.debug(f"Starting CLI transcription with arguments: {args}")
+
+    # Convert input paths to absolute paths
+    input_paths = [Path(p).resolve() for p in args.input]
+
+    if args.output and len(input_paths) > 1:
+        print("Error: --output is only supported with a single input file")
+        sys.exit(1)
+
+    for input_path in input_paths:
+        logger.debug(f"Input file: {input_path}")
+
+        # Check if input file exists
+        if not input_path.exists():
+            logger.error(f"Input file not found: {input_path}")
+            print(f"Error: Input file not found: {input_path}")
+            sys.exit(1)
+
+        # Check if pydub is available for conversion
+        if not PYDUB_AVAILABLE and input_path.suffix.lower() != '.wav' and not args.no_convert:
+            logger.warning("pydub is not installed but non-WAV format detected.")
+            print("Warning: pydub is not installed for audio format conversion.")
+            print("Attempting to process the file directly, which may not work with the OpenAI API.")
+
+        # Validate file format
+        if not validate_audio_format(input_path, args.force):
+            logger.error(f"Unsupported audio format: {input_path}")
+            print(f"Error: Unsupported audio format: {input_path}")
+            print(f"Supported formats: {', '.join(SUPPORTED_FORMATS)}")
+            print("Use --force to attempt processing this file anyway (may not work with OpenAI API)")
+            sys.exit(1)
+
+    # Determine output file paths (default: input filename with .txt extension)
+    if args.output:
+        jobs = [(input_paths[0], Path(args.output).resolve())]
+    else:
+        jobs = [(p, p.with_suffix(".txt")) for p in input_paths]
+
+    try:
+        # One transcriber for the whole batch - its pooled HTTP session
+        # is shared by all workers
+        transcriber = Transcriber()
+        logger.debug("Transcriber initialized")
+
+        # Override config settings if provided in arguments
+        transcriber.set_overrides(
+            language=args.language,
+            model=args.model,
+            temperature=args.temperature,
+            prompt=args.prompt,
+        )
+        if transcriber.overrides:
+            logger.debug(f"Config overrides from arguments: {transcriber.overrides}")
+
+        if len(jobs) == 1:
+            all_ok = process_file(transcriber, jobs[0][0], jobs[0][1], args, logger)
+        else:
+            # The work is network-bound, so files overlap on a thread
+            # pool and total wall time approaches the slowest file
+            # instead of the sum
+            with ThreadPoolExecutor(max_workers=min(args.concurrency, len(jobs))) as executor:
+                futures = [
+                    executor.submit(process_file, transcriber, inp, outp, args, logger)
+                    for inp, outp in jobs
+                ]
+                all_ok = all(future.result() for future in futures)
+
+        if not all_ok:
+            sys.exit(1)
+
         print(f"Transcription completed successfully!")
-        
+
     except Exception as e:
         logger.error(f"Transcription process failed: {e}")
-        import traceback
         logger.error(traceback.format_exc())
         print(f"Error: {e}")
         sys.exit(1)
@@ -6,10 +6,23 @@ for the speech-to-text application dashboard.
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Dict, Any
 from django.conf import settings
 
+# Optional C-backed JSON codec - stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Per-process cache of the parsed config keyed by the file's mtime -
+# dashboard GETs become a stat() plus a dict lookup unless the file
+# actually changed. The writer below refreshes it on save
+_cache = {"mtime": None, "data": None}
+
 
 def load_runtime_config() -> Dict[str, Any]:
     """
@@ -33,8 +46,16 @@ def load_runtime_config() -> Dict[str, Any]:
     
     try:
         if config_path.exists():
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            mtime = config_path.stat().st_mtime_ns
+            if mtime == _cache["mtime"]:
+                return _cache["data"]
+            if ORJSON_AVAILABLE:
+                config_data = orjson.loads(config_path.read_bytes())
+            else:
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    config_data = json.load(f)
+            _cache["mtime"] = mtime
+            _cache["data"] = config_data
             return config_data
         else:
             # Create default config file if it doesn't exist
@@ -60,10 +81,26 @@ def save_runtime_config(config_data: Dict[str, Any]) -> bool:
     try:
         # Ensure parent directory exists
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f, indent=2)
-        
+
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(config_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(config_data, indent=2).encode('utf-8')
+
+        # Write to a temp file and swap it in atomically - the
+        # transcriber reads this file on its hot path and must never see
+        # a half-written version
+        tmp_path = config_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, config_path)
+
+        # This process is the only writer, so refresh the cache in place
+        _cache["mtime"] = config_path.stat().st_mtime_ns
+        _cache["data"] = config_data
+
         print(f"Configuration saved to: {config_path}")
         return True
     except Exception as e: